@@ -10,6 +10,7 @@ import aiohttp
 import async_timeout
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .endpoints import get_action_endpoints, get_data_endpoints
 
@@ -34,6 +35,7 @@ class SectorAlarmAPI:
         self.access_token = None
         self.headers: dict[str, str] = {}
         self.session = None
+        self._login_lock = asyncio.Lock()
         self.data_endpoints = get_data_endpoints(self.panel_id)
         self.action_endpoints = get_action_endpoints()
 
@@ -55,7 +57,7 @@ class SectorAlarmAPI:
                             "Login failed with status code %s", response.status
                         )
                         raise AuthenticationError("Invalid credentials")
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     self.access_token = data.get("AuthorizationToken")
                     if not self.access_token:
                         _LOGGER.error("Login failed: No access token received")
@@ -77,7 +79,7 @@ class SectorAlarmAPI:
         data = {}
         panellist_url = f"{self.API_URL}/api/account/GetPanelList"
         response = await self._get(panellist_url)
-        _LOGGER.debug(f"panel_payload: {response}")
+        _LOGGER.debug("panel_payload: %s", response)
 
         if response:
             data = {
@@ -93,54 +95,58 @@ class SectorAlarmAPI:
     async def retrieve_all_data(self):
         """Retrieve all relevant data from the API."""
         data = {}
+        keys = []
+        requests = []
 
         # Iterate over data endpoints
         for key, (method, url) in self.data_endpoints.items():
             if method == "GET":
-                response = await self._get(url)
+                requests.append(self._get(url))
             elif method == "POST":
                 # For POST requests, we need to provide the panel ID in the payload
                 payload = {"PanelId": self.panel_id}
-                response = await self._post(url, payload)
+                requests.append(self._post(url, payload))
             else:
                 _LOGGER.error("Unsupported HTTP method %s for endpoint %s", method, key)
                 continue
+            keys.append(key)
 
+        # Fetch all endpoints concurrently, a failing endpoint only drops its data
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+
+        for key, response in zip(keys, responses, strict=True):
+            if isinstance(response, (AuthenticationError, asyncio.CancelledError)):
+                raise response
+            if isinstance(response, Exception):
+                _LOGGER.error("Failed to retrieve data for %s: %s", key, response)
+                continue
             if response:
                 data[key] = response
             else:
                 _LOGGER.info("No data retrieved for %s", key)
 
-        locks_status = await self.get_lock_status()
-        data["Lock Status"] = locks_status
-
         return data
 
-    async def get_lock_status(self):
-        """Retrieve the lock status."""
-        url = f"{self.API_URL}/api/panel/GetLockStatus?panelId={self.panel_id}"
-        response = await self._get(url)
-        if response:
-            return response
-        else:
-            _LOGGER.error("Failed to retrieve lock status")
-            return []
-
-    async def _get(self, url):
+    async def _get(self, url, retry_login: bool = True):
         """Helper method to perform GET requests with timeout."""
+        access_token = self.access_token
         try:
             async with async_timeout.timeout(10):
                 async with self.session.get(url, headers=self.headers) as response:
                     if response.status == 200:
                         content_type = response.headers.get("Content-Type", "")
                         if "application/json" in content_type:
-                            return await response.json()
+                            return await response.json(loads=json_loads)
                         else:
                             text = await response.text()
                             _LOGGER.error(
                                 "Received non-JSON response from %s: %s", url, text
                             )
                             return None
+                    elif response.status == 401 and retry_login:
+                        _LOGGER.debug(
+                            "Access token rejected by %s, logging in again", url
+                        )
                     else:
                         text = await response.text()
                         _LOGGER.error(
@@ -157,8 +163,12 @@ class SectorAlarmAPI:
             _LOGGER.error("Client error during GET request to %s: %s", url, str(e))
             return None
 
-    async def _post(self, url, payload):
+        await self._relogin(access_token)
+        return await self._get(url, retry_login=False)
+
+    async def _post(self, url, payload, retry_login: bool = True):
         """Helper method to perform POST requests with timeout."""
+        access_token = self.access_token
         try:
             async with async_timeout.timeout(10):
                 async with self.session.post(
@@ -167,13 +177,17 @@ class SectorAlarmAPI:
                     if response.status == 200:
                         content_type = response.headers.get("Content-Type", "")
                         if "application/json" in content_type:
-                            return await response.json()
+                            return await response.json(loads=json_loads)
                         else:
                             text = await response.text()
                             _LOGGER.error(
                                 "Received non-JSON response from %s: %s", url, text
                             )
                             return None
+                    elif response.status == 401 and retry_login:
+                        _LOGGER.debug(
+                            "Access token rejected by %s, logging in again", url
+                        )
                     else:
                         text = await response.text()
                         _LOGGER.error(
@@ -190,6 +204,41 @@ class SectorAlarmAPI:
             _LOGGER.error("Client error during POST request to %s: %s", url, str(err))
             return None
 
+        await self._relogin(access_token)
+        return await self._post(url, payload, retry_login=False)
+
+    async def _relogin(self, rejected_token: str | None) -> None:
+        """Login again after the access token was rejected.
+
+        Raises AuthenticationError if the login fails.
+        """
+        async with self._login_lock:
+            if self.access_token != rejected_token:
+                # A concurrent request failed to login with the same token,
+                # don't retry it
+                if self.access_token is None:
+                    raise AuthenticationError("Login failed")
+                # A concurrent request already renewed the token
+                return
+            try:
+                await self.login()
+            except AuthenticationError:
+                # Clear the token so waiting requests and the next update
+                # don't keep logging in with rejected credentials
+                self.access_token = None
+                raise
+
+    async def _post_action(self, url, payload):
+        """Perform a POST request for a user action.
+
+        Returns None if the request fails, including when logging in again fails.
+        """
+        try:
+            return await self._post(url, payload)
+        except AuthenticationError:
+            _LOGGER.error("Login failed during POST request to %s", url)
+            return None
+
     async def arm_system(self, mode: str, code: str):
         """Arm the alarm system."""
         panel_code = code
@@ -202,7 +251,7 @@ class SectorAlarmAPI:
             "PanelCode": panel_code,
             "PanelId": self.panel_id,
         }
-        result = await self._post(url, payload)
+        result = await self._post_action(url, payload)
         if result is not None:
             _LOGGER.debug("System armed successfully")
             return True
@@ -218,7 +267,7 @@ class SectorAlarmAPI:
             "PanelCode": panel_code,
             "PanelId": self.panel_id,
         }
-        result = await self._post(url, payload)
+        result = await self._post_action(url, payload)
         if result is not None:
             _LOGGER.debug("System disarmed successfully")
             return True
@@ -236,7 +285,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
-        result = await self._post(url, payload)
+        result = await self._post_action(url, payload)
         if result is not None:
             _LOGGER.debug("Door %s locked successfully", serial_no)
             return True
@@ -254,7 +303,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
-        result = await self._post(url, payload)
+        result = await self._post_action(url, payload)
         if result is not None:
             _LOGGER.debug("Door %s unlocked successfully", serial_no)
             return True
@@ -269,7 +318,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "DeviceId": plug_id,
         }
-        result = await self._post(url, payload)
+        result = await self._post_action(url, payload)
         if result is not None:
             _LOGGER.debug("Smart plug %s turned on successfully", plug_id)
             return True
@@ -284,7 +333,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "DeviceId": plug_id,
         }
-        result = await self._post(url, payload)
+        result = await self._post_action(url, payload)
         if result is not None:
             _LOGGER.debug("Smart plug %s turned off successfully", plug_id)
             return True
@@ -299,7 +348,7 @@ class SectorAlarmAPI:
             "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
-        response = await self._post(url, payload)
+        response = await self._post_action(url, payload)
         if response and response.get("ImageData"):
             image_data = base64.b64decode(response["ImageData"])
             return image_data
@@ -309,4 +358,4 @@ class SectorAlarmAPI:
     async def logout(self):
         """Logout from the API."""
         logout_url = f"{self.API_URL}/api/Login/Logout"
-        await self._post(logout_url, {})
+        await self._post_action(logout_url, {})
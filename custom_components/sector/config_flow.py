@@ -116,7 +116,7 @@ class SectorAlarmConfigFlow(ConfigFlow, domain=DOMAIN):
                 panel_list = await api.get_panel_list()
 
                 self.panel_ids = panel_list
-                _LOGGER.debug(f"panel_ids: {self.panel_ids}")
+                _LOGGER.debug("panel_ids: %s", self.panel_ids)
                 if not self.panel_ids:
                     errors["base"] = "no_panels_found"
                 elif len(self.panel_ids) == 1:
@@ -1,6 +1,9 @@
 """Sector Alarm coordinator."""
 
 import logging
+import random
+from collections import defaultdict
+from collections.abc import Callable, Iterator
 from datetime import timedelta
 from typing import Any
 
@@ -14,6 +17,53 @@ from .const import CATEGORY_MODEL_MAPPING, CONF_PANEL_ID, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_UPDATE_INTERVAL = timedelta(seconds=60)
+# Spread polls by up to +/- 10% so instances don't hit the API in lockstep
+_UPDATE_INTERVAL_JITTER = 0.1
+# Upper bound for the update interval while backing off after failed updates
+_MAX_UPDATE_INTERVAL = timedelta(minutes=10)
+# Doublings of the update interval needed to reach the upper bound
+_MAX_BACKOFF_EXPONENT = 4
+
+# Sensor key, component keys to read it from and value transform
+_SENSOR_SOURCES: tuple[tuple[str, tuple[str, ...], type], ...] = (
+    ("closed", ("Closed",), bool),
+    ("low_battery", ("LowBattery", "BatteryLow"), bool),
+    ("alarm", ("Alarm",), bool),
+    ("temperature", ("Temperature",), float),
+    ("humidity", ("Humidity",), float),
+)
+
+# Categories which are not processed into devices
+_SKIPPED_CATEGORIES = frozenset({"Logs", "Panel Status"})
+
+
+def _jittered_interval(interval: timedelta) -> timedelta:
+    """Return the interval with random jitter applied."""
+    return interval * random.uniform(
+        1 - _UPDATE_INTERVAL_JITTER, 1 + _UPDATE_INTERVAL_JITTER
+    )
+
+
+def _backoff_interval(failed_updates: int) -> timedelta:
+    """Return the jittered exponential backoff interval after failed updates."""
+    exponent = min(failed_updates, _MAX_BACKOFF_EXPONENT)
+    backoff = min(_UPDATE_INTERVAL * 2**exponent, _MAX_UPDATE_INTERVAL)
+    return backoff * random.uniform(0.5, 1.0)
+
+
+def _iter_components(category_data: dict) -> Iterator[tuple[str, dict]]:
+    """Yield serial number and component for all components of a category."""
+    for section in category_data["Sections"]:
+        for place in section.get("Places", ()):
+            for component in place.get("Components", ()):
+                serial_no = component.get("SerialNo") or component.get("Serial")
+                if not serial_no:
+                    _LOGGER.warning("Component missing SerialNo/Serial: %s", component)
+                    continue
+                yield str(serial_no), component
+
+
 # Make sure the SectorAlarmConfigEntry type is present
 type SectorAlarmConfigEntry = ConfigEntry[SectorDataUpdateCoordinator]
 
@@ -32,27 +82,49 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
             password=entry.data[CONF_PASSWORD],
             panel_id=entry.data[CONF_PANEL_ID],
         )
+        self._lock_names: dict[str, str] = {}
+        self._event_logs: dict[str, Any] = {}
+        self._event_logs_source: tuple[list, dict[str, str]] | None = None
+        self._last_api_data: dict[str, Any] | None = None
+        self._failed_updates = 0
+        self._category_handlers: dict[str, Callable[[Any, dict], None]] = {
+            "Lock Status": self._process_locks,
+        }
         super().__init__(
             hass,
             _LOGGER,
             config_entry=entry,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=_jittered_interval(_UPDATE_INTERVAL),
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Sector Alarm API."""
         try:
-            await self.api.login()
+            # The access token is reused between updates, the client logs in
+            # again by itself if the API rejects it
+            if self.api.access_token is None:
+                await self.api.login()
             api_data = await self.api.retrieve_all_data()
             _LOGGER.debug("API ALL DATA: %s", api_data)
+            if not api_data:
+                raise UpdateFailed("No data retrieved from Sector Alarm API")
+
+            self._failed_updates = 0
+            self.update_interval = _jittered_interval(_UPDATE_INTERVAL)
+
+            # The API returned the same data as last time, reuse the processed data
+            if self.data is not None and api_data == self._last_api_data:
+                _LOGGER.debug("API data unchanged, skipping processing")
+                return self.data
 
             # Process devices and panel status
             devices, panel_status = self._process_devices(api_data)
 
             # Process logs for event handling
             logs_data = api_data.get("Logs", [])
-            self._event_logs = self._process_event_logs(logs_data, devices)
+            self._event_logs = self._process_event_logs(logs_data)
+            self._last_api_data = api_data
 
             return {
                 "devices": devices,
@@ -60,24 +132,37 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
                 "logs": self._event_logs,
             }
 
+        except UpdateFailed:
+            self._schedule_backoff()
+            raise
         except AuthenticationError as error:
+            self._schedule_backoff()
             raise UpdateFailed(f"Authentication failed: {error}") from error
         except Exception as error:
             _LOGGER.exception("Failed to update data")
+            self._schedule_backoff()
             raise UpdateFailed(f"Failed to update data: {error}") from error
 
+    def _schedule_backoff(self) -> None:
+        """Back off the next update after a failed update."""
+        if self._failed_updates < _MAX_BACKOFF_EXPONENT:
+            self._failed_updates += 1
+        self.update_interval = _backoff_interval(self._failed_updates)
+
     def _process_devices(self, api_data) -> tuple[dict[str, Any], dict[str, Any]]:
         """Process device data from the API, including humidity, closed, and alarm sensors."""
         devices: dict[str, Any] = {}
         panel_status = api_data.get("Panel Status", {})
+        self._lock_names = {}
 
         for category_name, category_data in api_data.items():
-            if category_name in ["Logs", "Panel Status"]:
+            if category_name in _SKIPPED_CATEGORIES:
                 continue
 
             _LOGGER.debug("Processing category: %s", category_name)
-            if category_name == "Lock Status" and isinstance(category_data, list):
-                self._process_locks(category_data, devices)
+            handler = self._category_handlers.get(category_name)
+            if handler is not None:
+                handler(category_data, devices)
             else:
                 self._process_category_devices(category_name, category_data, devices)
 
@@ -85,11 +170,15 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _process_locks(self, locks_data: list, devices: dict) -> None:
         """Process lock data and add to devices dictionary."""
+        if not isinstance(locks_data, list):
+            _LOGGER.debug("Lock Status is not a list: %s", locks_data)
+            return
+
         for lock in locks_data:
-            serial_no = str(lock.get("Serial"))
-            if not serial_no:
+            if not (serial_no := lock.get("Serial")):
                 _LOGGER.warning("Lock missing Serial: %s", lock)
                 continue
+            serial_no = str(serial_no)
 
             devices[serial_no] = {
                 "name": lock.get("Label"),
@@ -100,6 +189,7 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
                 },
                 "model": "Smart Lock",
             }
+            self._lock_names[lock.get("Label")] = serial_no
             _LOGGER.debug(
                 "Processed lock with serial_no %s: %s", serial_no, devices[serial_no]
             )
@@ -108,103 +198,49 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
         self, category_name: str, category_data: dict, devices: dict
     ) -> None:
         """Process devices within a specific category and add them to devices dictionary."""
-        default_model_name = CATEGORY_MODEL_MAPPING.get(category_name, category_name)
-
-        if isinstance(category_data, dict) and "Sections" in category_data:
-            for section in category_data["Sections"]:
-                for place in section.get("Places", []):
-                    for component in place.get("Components", []):
-                        serial_no = str(
-                            component.get("SerialNo") or component.get("Serial")
-                        )
-                        if serial_no:
-                            device_type = str(component.get("Type", "")).lower()
-                            model_name = CATEGORY_MODEL_MAPPING.get(
-                                device_type, default_model_name
-                            )
-
-                            # Initialize or update device entry with sensors
-                            device_info = devices.setdefault(
-                                serial_no,
-                                {
-                                    "name": component.get("Label")
-                                    or component.get("Name"),
-                                    "serial_no": serial_no,
-                                    "sensors": {},
-                                    "model": model_name,
-                                    "type": component.get("Type", ""),
-                                },
-                            )
-
-                            # Add or update each sensor in the device
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "closed",
-                                "Closed",
-                                bool,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "low_battery",
-                                ["LowBattery", "BatteryLow"],
-                                bool,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "alarm",
-                                "Alarm",
-                                bool,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "temperature",
-                                "Temperature",
-                                float,
-                            )
-                            self._add_sensor_if_present(
-                                device_info["sensors"],
-                                component,
-                                "humidity",
-                                "Humidity",
-                                float,
-                            )
-
-                            _LOGGER.debug(
-                                "Processed device %s with model: %s, category: %s, type: %s",
-                                serial_no,
-                                model_name,
-                                category_name,
-                                device_type,
-                            )
-                        else:
-                            _LOGGER.warning(
-                                "Component missing SerialNo/Serial: %s", component
-                            )
-        else:
+        default_model_name = CATEGORY_MODEL_MAPPING.get(
+            category_name.lower(), category_name
+        )
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        get_model_name = CATEGORY_MODEL_MAPPING.get
+        # Components in a category share a few types, resolve each type once
+        type_models: dict[Any, tuple[str, str]] = {}
+
+        if not (isinstance(category_data, dict) and "Sections" in category_data):
             _LOGGER.debug("Category %s does not contain Sections.", category_name)
+            return
+
+        for serial_no, component in _iter_components(category_data):
+            component_type = component.get("Type", "")
+            if (type_model := type_models.get(component_type)) is None:
+                device_type = str(component_type).lower()
+                type_model = type_models[component_type] = (
+                    device_type,
+                    get_model_name(device_type, default_model_name),
+                )
+            device_type, model_name = type_model
+
+            # Initialize or update device entry with sensors
+            device_info = devices.setdefault(
+                serial_no,
+                {
+                    "name": component.get("Label") or component.get("Name"),
+                    "serial_no": serial_no,
+                    "sensors": {},
+                    "model": model_name,
+                    "type": component_type,
+                },
+            )
 
-    def _add_sensor_if_present(
-        self,
-        sensors: dict,
-        component: dict,
-        sensor_key: str,
-        source_keys: Any,
-        transform: type | None = None,
-    ):
-        """Add a sensor to the sensors dictionary if it exists in component."""
-        if isinstance(source_keys, str):
-            source_keys = [source_keys]
-
-        for key in source_keys:
-            if key in component:
-                value = component[key]
-                if transform:
+            # Add or update each sensor in the device
+            sensors = device_info["sensors"]
+            for sensor_key, source_keys, transform in _SENSOR_SOURCES:
+                # Use the first source key present in the component
+                for key in source_keys:
+                    if (value := component.get(key)) is None:
+                        continue
                     try:
-                        value = transform(value)
+                        sensors[sensor_key] = transform(value)
                     except ValueError as e:
                         _LOGGER.warning(
                             "Failed to transform value '%s' for key '%s': %s",
@@ -212,34 +248,37 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
                             key,
                             e,
                         )
-                        return  # Skip adding this sensor if transformation fails
+                    break
 
-                # Add sensor to the dictionary if found and transformed successfully
-                sensors[sensor_key] = value
+            if debug_enabled:
                 _LOGGER.debug(
-                    "Successfully added sensor '%s' with value '%s' to sensors",
-                    sensor_key,
-                    value,
+                    "Processed device %s with model: %s, category: %s, type: %s, sensors: %s",
+                    serial_no,
+                    model_name,
+                    category_name,
+                    device_type,
+                    sensors,
                 )
-                return  # Exit after the first match to avoid overwriting
-
-        # Log a debug message if none of the source keys are found
-        _LOGGER.debug(
-            "Sensor keys %s were not found in component for sensor '%s'",
-            source_keys,
-            sensor_key,
-        )
 
-    def _process_event_logs(self, logs, devices):
+    def _process_event_logs(self, logs):
         """Process event logs, associating them with the correct lock devices using LockName."""
-        grouped_events = {}
+        # Logs are unchanged since the last update, reuse the grouped events
+        source = (logs, self._lock_names)
+        if self._event_logs_source == source:
+            _LOGGER.debug("Event logs unchanged, skipping processing")
+            return self._event_logs
+        # Logs are only mapped to locks, nothing to do without either
+        if not logs or not self._lock_names:
+            self._event_logs_source = source
+            return {}
+
+        grouped_events: defaultdict[str, defaultdict[str, list]] = defaultdict(
+            lambda: defaultdict(list)
+        )
         _LOGGER.debug("Starting event log processing. Total logs: %d", len(logs))
 
-        lock_names = {
-            device["name"]: serial_no
-            for serial_no, device in devices.items()
-            if device.get("model") == "Smart Lock"
-        }
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        lock_names = self._lock_names
 
         for log_entry in logs:
             lock_name = log_entry.get("LockName")
@@ -254,19 +293,14 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
 
             serial_no = lock_names.get(lock_name)
             if not serial_no:
-                _LOGGER.debug(
-                    "Log entry for unknown lock name '%s', skipping: %s",
-                    lock_name,
-                    log_entry,
-                )
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Log entry for unknown lock name '%s', skipping: %s",
+                        lock_name,
+                        log_entry,
+                    )
                 continue
 
-            if serial_no not in grouped_events:
-                grouped_events[serial_no] = {}
-
-            if event_type not in grouped_events[serial_no]:
-                grouped_events[serial_no][event_type] = []
-
             grouped_events[serial_no][event_type].append(
                 {
                     "time": timestamp,
@@ -275,18 +309,22 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
                 }
             )
 
-            _LOGGER.debug(
-                "Processed log entry for lock '%s' (serial %s) with event type '%s' at %s by %s via %s",
-                lock_name,
-                serial_no,
-                event_type,
-                timestamp,
-                user or "unknown user",
-                channel or "unknown channel",
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Processed log entry for lock '%s' (serial %s) with event type '%s' at %s by %s via %s",
+                    lock_name,
+                    serial_no,
+                    event_type,
+                    timestamp,
+                    user or "unknown user",
+                    channel or "unknown channel",
+                )
 
-        _LOGGER.debug("Grouped events by lock: %s", grouped_events)
-        return grouped_events
+        if debug_enabled:
+            _LOGGER.debug("Grouped events by lock: %s", grouped_events)
+        # Only remember the source once grouping succeeded
+        self._event_logs_source = source
+        return {serial_no: dict(events) for serial_no, events in grouped_events.items()}
 
     async def process_events(self):
         """Return processed event logs grouped by device."""
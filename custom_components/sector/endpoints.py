@@ -12,7 +12,6 @@ def get_data_endpoints(panel_id):
         "Leakage Detectors": ("POST", f"{API_URL}/api/v2/housecheck/leakagedetectors"),
         "Smoke Detectors": ("POST", f"{API_URL}/api/v2/housecheck/smokedetectors"),
         "Cameras": ("GET", f"{API_URL}/api/v2/housecheck/cameras/{panel_id}"),
-        "Persons": ("GET", f"{API_URL}/api/persons/panels/{panel_id}"),
         "Temperatures": ("POST", f"{API_URL}/api/v2/housecheck/temperatures"),
         # Panel endpoints
         "Panel Status": (
@@ -81,8 +81,8 @@ class SectorAlarmEvent(SectorAlarmBaseEntity, EventEntity):
 
     def _trigger_event(self, event_type, event_attributes):
         """Trigger an event with timestamp and details."""
-        event_timestamp = event_attributes.get(
-            "Time", datetime.now(timezone.utc).isoformat()
+        event_timestamp = (
+            event_attributes.get("time") or datetime.now(timezone.utc).isoformat()
         )
         event_attributes["timestamp"] = event_timestamp
         _LOGGER.debug(
@@ -106,9 +106,9 @@ class SectorAlarmEvent(SectorAlarmBaseEntity, EventEntity):
 
         recent_event = self._events[-1]
         return {
-            "time": recent_event.get("Time"),
-            "user": recent_event.get("User", "unknown"),
-            "channel": recent_event.get("Channel", "unknown"),
+            "time": recent_event.get("time"),
+            "user": recent_event.get("user") or "unknown",
+            "channel": recent_event.get("channel") or "unknown",
         }
 
     @property